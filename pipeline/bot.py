@@ -12,17 +12,21 @@ Requires .env with:
 """
 
 import asyncio
-import json
 import logging
 import os
 import re
 import sys
+import time
 import unicodedata
+from collections import deque
 from datetime import datetime, timezone
+from html import escape
 from pathlib import Path
+from string import Template
 
 from dotenv import load_dotenv
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
+from telegram.error import RetryAfter
 from telegram.ext import (
     Application,
     CallbackQueryHandler,
@@ -31,9 +35,13 @@ from telegram.ext import (
     MessageHandler,
     filters,
 )
+from telegram.request import HTTPXRequest
 
-from publish_remote import publish_to_github
-from scraper import get_candidates
+from store import BloomFilter, Store
+
+# scraper and publish_remote are imported lazily inside the handlers that
+# need them — they pull in feedparser, openai and aiohttp, which adds
+# hundreds of ms to cold start and stays resident in the long-running bot.
 
 # ---------------------------------------------------------------------------
 # Config
@@ -51,12 +59,92 @@ logging.basicConfig(
 log = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
-# In-memory stores
+# State stores (in-memory, mirrored to SQLite for crash safety)
 # ---------------------------------------------------------------------------
-pending: dict[str, dict] = {}      # id -> article candidate
-published: list[str] = []           # list of published titles
+store = Store()
+
+pending: dict[str, dict] = {}       # id -> article candidate (authoritative)
+pending_ts: dict[str, float] = {}   # id -> monotonic insert time
+pending_dirty: set[str] = set()     # ids not yet flushed to SQLite
+pending_on_disk: set[str] = set()   # ids known to be in SQLite
+published: deque[str] = deque(maxlen=500)  # recently published titles
+published_bloom = BloomFilter()             # all published titles ever (dedup)
 editing: dict[int, str] = {}        # chat_id -> article id being edited
 
+PENDING_TTL = 24 * 3600  # drop candidates the admin never acted on after a day
+
+
+def remember_pending(article_id: str, article: dict) -> None:
+    # Write-behind: the in-memory dict is authoritative, SQLite catches up
+    # in flush_pending_dirty. Candidates approved or rejected before the
+    # next flush never touch disk at all.
+    pending[article_id] = article
+    pending_ts[article_id] = time.monotonic()
+    pending_dirty.add(article_id)
+
+
+def forget_pending(article_id: str) -> None:
+    pending.pop(article_id, None)
+    pending_ts.pop(article_id, None)
+    pending_dirty.discard(article_id)
+    if article_id in pending_on_disk:
+        store.delete_pending(article_id)
+        pending_on_disk.discard(article_id)
+
+
+def flush_pending_dirty() -> None:
+    """Batch-write dirty pending entries to SQLite in one transaction."""
+    if not pending_dirty:
+        return
+    batch = [(article_id, pending[article_id]) for article_id in pending_dirty if article_id in pending]
+    if batch:
+        store.put_pending_many(batch)
+        pending_on_disk.update(article_id for article_id, _ in batch)
+    pending_dirty.clear()
+
+class TokenBucket:
+    """
+    Async token bucket for pacing outbound Telegram messages.
+
+    Everything we send goes to the single ADMIN_CHAT_ID, where Telegram's
+    per-chat limit is ~1 message/sec (the ~30/sec figure is the global
+    cap across chats). A small burst allowance covers the header message
+    plus the first candidates; after that, acquirers sleep for exactly
+    the token deficit instead of a fixed per-message delay.
+    """
+
+    def __init__(self, capacity: float = 3, refill_rate: float = 1.0):
+        self.capacity = capacity
+        self.refill_rate = refill_rate  # tokens per second
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated) * self.refill_rate,
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Take one token, waiting for the exact deficit if the bucket is empty."""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.refill_rate)
+                self._refill()
+            self._tokens -= 1
+
+    def drain(self, seconds: float) -> None:
+        """Empty the bucket so acquirers back off for `seconds` (e.g. after a 429)."""
+        self._tokens = min(self._tokens, 0.0) - seconds * self.refill_rate
+        self._updated = time.monotonic()
+
+
+send_bucket = TokenBucket()
+
 CATEGORY_EMOJI = {
     "ai": "🧠",
     "gaming": "🎮",
@@ -67,6 +155,32 @@ CATEGORY_EMOJI = {
     "robotics": "🤖",
 }
 
+# Precompiled pattern: slugify runs on every candidate, so skip the
+# re-cache lookup per call.
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+def _make_candidate_template(category_label: str) -> Template:
+    """Build the candidate-message skeleton with the category line baked in."""
+    return Template(
+        "📰 <b>NEW ARTICLE CANDIDATE</b>\n\n"
+        f"Category: {category_label}\n"
+        "Title: <b>$title</b>\n\n"
+        "Excerpt: <i>$excerpt</i>\n\n"
+        "Source: $source\n"
+        "Location: 📍 $geo\n"
+        "Tags: $tags\n"
+    )
+
+
+# Per-category templates: everything except title/excerpt/source/geo/tags is
+# invariant per category, so bake it in once at module load.
+_CANDIDATE_TMPL = {
+    cat: _make_candidate_template(f"{emoji} <b>{cat.upper()}</b>")
+    for cat, emoji in CATEGORY_EMOJI.items()
+}
+_CANDIDATE_TMPL_DEFAULT = _make_candidate_template("📰 <b>$category</b>")
+
 
 def slugify(text: str) -> str:
     """Convert text to URL-friendly ASCII-only slug."""
@@ -74,8 +188,8 @@ def slugify(text: str) -> str:
     # Decompose diacritics (š→s, č→c, ž→z, etc.) then drop combining marks
     text = unicodedata.normalize("NFKD", text)
     text = text.encode("ascii", "ignore").decode("ascii")
-    text = re.sub(r"[^a-z0-9]+", "-", text)
-    return text.strip("-")[:60].rstrip("-")
+    text = _SLUG_RE.sub("-", text)
+    return text[:60].strip("-")
 
 
 def make_article_id(title: str) -> str:
@@ -90,19 +204,28 @@ def make_article_id(title: str) -> str:
 def format_candidate(article: dict) -> str:
     """Format article candidate for Telegram message."""
     cat = article.get("category", "technology")
-    emoji = CATEGORY_EMOJI.get(cat, "📰")
-    geo_name = article.get("geo", {}).get("name", "Global")
-    tags = " ".join(f"#{t.replace('-', '_')}" for t in article.get("tags", [])[:5])
-
-    return (
-        f"📰 <b>NEW ARTICLE CANDIDATE</b>\n\n"
-        f"Category: {emoji} <b>{cat.upper()}</b>\n"
-        f"Title: <b>{article.get('title', 'Untitled')}</b>\n\n"
-        f"Excerpt: <i>{article.get('excerpt', '')[:200]}</i>\n\n"
-        f"Source: {article.get('source', {}).get('name', 'Unknown')}\n"
-        f"Location: 📍 {geo_name}\n"
-        f"Tags: {tags}\n"
-    )
+    # Escape user-controlled fields once here — the result goes out with
+    # parse_mode="HTML" and Telegram rejects unbalanced markup with a 400.
+    fields = {
+        "title": escape(article.get("title", "Untitled")),
+        "excerpt": escape(article.get("excerpt", "")[:200]),
+        "source": escape(article.get("source", {}).get("name", "Unknown")),
+        "geo": escape(article.get("geo", {}).get("name", "Global")),
+        "tags": escape(" ".join(f"#{t.replace('-', '_')}" for t in article.get("tags", [])[:5])),
+    }
+
+    tmpl = _CANDIDATE_TMPL.get(cat)
+    if tmpl is None:
+        return _CANDIDATE_TMPL_DEFAULT.substitute(fields, category=escape(cat.upper()))
+    return tmpl.substitute(fields)
+
+
+def candidate_html(article: dict) -> str:
+    """Return the candidate message, formatting and escaping only once."""
+    cached = article.get("_formatted_html")
+    if cached is None:
+        cached = article["_formatted_html"] = format_candidate(article)
+    return cached
 
 
 def make_buttons(article_id: str) -> InlineKeyboardMarkup:
@@ -166,11 +289,11 @@ async def cmd_test(update: Update, ctx: ContextTypes.DEFAULT_TYPE):
     }
 
     article_id = test_article["id"]
-    pending[article_id] = test_article
+    remember_pending(article_id, test_article)
 
     await ctx.bot.send_message(
         chat_id=update.effective_chat.id,
-        text=format_candidate(test_article),
+        text=candidate_html(test_article),
         reply_markup=make_buttons(article_id),
         parse_mode="HTML",
     )
@@ -199,7 +322,7 @@ async def handle_callback(update: Update, ctx: ContextTypes.DEFAULT_TYPE):
 
     if action == "approve":
         await query.edit_message_text(
-            f"⏳ Publishing: <b>{article['title']}</b>...",
+            f"⏳ Publishing: <b>{escape(article['title'])}</b>...",
             parse_mode="HTML",
         )
 
@@ -222,36 +345,39 @@ async def handle_callback(update: Update, ctx: ContextTypes.DEFAULT_TYPE):
         }
 
         # Publish via GitHub API (no local access needed)
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, publish_to_github, article_payload)
+        from publish_remote import publish_to_github
+
+        result = await publish_to_github(article_payload)
 
         if result["success"]:
             published.append(article["title"])
-            del pending[article_id]
+            published_bloom.add(article["title"])
+            store.add_published(article["title"])
+            forget_pending(article_id)
             await query.edit_message_text(
-                f"✅ <b>Published:</b> {article['title']}\n\n"
+                f"✅ <b>Published:</b> {escape(article['title'])}\n\n"
                 f"🌐 Vercel auto-deploy triggered. Live in ~60 seconds.",
                 parse_mode="HTML",
             )
         else:
             await query.edit_message_text(
-                f"❌ <b>Publish failed:</b> {article['title']}\n"
-                f"Error: {result['message']}",
+                f"❌ <b>Publish failed:</b> {escape(article['title'])}\n"
+                f"Error: {escape(result['message'])}",
                 parse_mode="HTML",
             )
 
     elif action == "reject":
         title = article["title"]
-        del pending[article_id]
+        forget_pending(article_id)
         await query.edit_message_text(
-            f"❌ <b>Rejected:</b> {title}",
+            f"❌ <b>Rejected:</b> {escape(title)}",
             parse_mode="HTML",
         )
 
     elif action == "edit":
         editing[query.from_user.id] = article_id
         await query.edit_message_text(
-            f"✏️ <b>Editing:</b> {article['title']}\n\n"
+            f"✏️ <b>Editing:</b> {escape(article['title'])}\n\n"
             f"Send me the new title:",
             parse_mode="HTML",
         )
@@ -271,15 +397,16 @@ async def handle_message(update: Update, ctx: ContextTypes.DEFAULT_TYPE):
 
         new_title = update.message.text.strip()
         article["title"] = new_title
+        article.pop("_formatted_html", None)  # title changed — recompute
 
         # Generate new ID based on new title
         new_id = make_article_id(new_title)
         article["id"] = new_id
-        del pending[article_id]
-        pending[new_id] = article
+        forget_pending(article_id)
+        remember_pending(new_id, article)
 
         await update.message.reply_text(
-            f"✅ Title updated!\n\n" + format_candidate(article),
+            f"✅ Title updated!\n\n" + candidate_html(article),
             reply_markup=make_buttons(new_id),
             parse_mode="HTML",
         )
@@ -291,8 +418,16 @@ async def handle_message(update: Update, ctx: ContextTypes.DEFAULT_TYPE):
 async def run_scrape(ctx: ContextTypes.DEFAULT_TYPE):
     """Run the scraper and send candidates to admin."""
     try:
-        loop = asyncio.get_event_loop()
-        candidates = await loop.run_in_executor(None, get_candidates)
+        from scraper import get_candidates
+
+        candidates = await asyncio.to_thread(get_candidates)
+
+        # Drop candidates whose title we've already published — don't spend
+        # Telegram rate-limit budget re-sending articles the admin has seen.
+        fresh = [c for c in candidates if c.get("title") not in published_bloom]
+        if len(fresh) < len(candidates):
+            log.info(f"Dropped {len(candidates) - len(fresh)} already-published candidate(s)")
+        candidates = fresh
 
         if not candidates:
             await ctx.bot.send_message(
@@ -307,20 +442,35 @@ async def run_scrape(ctx: ContextTypes.DEFAULT_TYPE):
             parse_mode="HTML",
         )
 
-        for candidate in candidates:
+        async def send_one(candidate: dict) -> None:
             article_id = candidate.get("id") or make_article_id(candidate.get("title", "untitled"))
             candidate["id"] = article_id
-            pending[article_id] = candidate
-
-            await ctx.bot.send_message(
-                chat_id=ADMIN_CHAT_ID,
-                text=format_candidate(candidate),
-                reply_markup=make_buttons(article_id),
-                parse_mode="HTML",
-            )
-
-            # Small delay to avoid Telegram rate limits
-            await asyncio.sleep(1)
+            remember_pending(article_id, candidate)
+
+            while True:
+                await send_bucket.acquire()
+                try:
+                    await ctx.bot.send_message(
+                        chat_id=ADMIN_CHAT_ID,
+                        text=candidate_html(candidate),
+                        reply_markup=make_buttons(article_id),
+                        parse_mode="HTML",
+                    )
+                    return
+                except RetryAfter as e:
+                    # Telegram told us to back off — drain the bucket so
+                    # other senders wait too, then retry. Giving up would
+                    # leave the candidate in pending with no buttons ever
+                    # shown to the admin.
+                    send_bucket.drain(e.retry_after)
+
+        results = await asyncio.gather(
+            *(send_one(c) for c in candidates),
+            return_exceptions=True,
+        )
+        for r in results:
+            if isinstance(r, Exception):
+                log.error(f"Failed to send candidate: {r}")
 
     except Exception as e:
         log.error(f"Scrape failed: {e}")
@@ -338,6 +488,21 @@ async def scheduled_scrape(ctx: ContextTypes.DEFAULT_TYPE):
     await run_scrape(ctx)
 
 
+async def flush_pending_job(ctx: ContextTypes.DEFAULT_TYPE):
+    """Write-behind flush callback for JobQueue."""
+    flush_pending_dirty()
+
+
+async def evict_stale_pending(ctx: ContextTypes.DEFAULT_TYPE):
+    """Hourly job: drop pending candidates the admin never acted on."""
+    cutoff = time.monotonic() - PENDING_TTL
+    stale = [article_id for article_id, ts in pending_ts.items() if ts < cutoff]
+    for article_id in stale:
+        forget_pending(article_id)
+    if stale:
+        log.info(f"Evicted {len(stale)} stale pending candidate(s)")
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -352,7 +517,40 @@ def main():
 
     log.info("Starting Tech Pulse Pipeline Bot...")
 
-    app = Application.builder().token(BOT_TOKEN).build()
+    # Restore durable state from previous runs
+    now = time.monotonic()
+    for article_id, article in store.load_pending().items():
+        pending[article_id] = article
+        pending_ts[article_id] = now
+        pending_on_disk.add(article_id)
+    published.extend(store.load_published(limit=published.maxlen))
+    for title in store.all_published_titles():
+        published_bloom.add(title)
+    log.info(f"Restored {len(pending)} pending / {len(published)} published from {store.path.name}")
+
+    async def _on_shutdown(app: Application) -> None:
+        flush_pending_dirty()
+        if "publish_remote" in sys.modules:
+            from publish_remote import close_session
+
+            await close_session()
+
+    # Default pool size serializes parallel send_message calls; give the send
+    # path room for the fan-out in run_scrape and keep long-polling on its
+    # own connection so getUpdates never starves sends.
+    app = (
+        Application.builder()
+        .token(BOT_TOKEN)
+        .request(HTTPXRequest(
+            connection_pool_size=20,
+            connect_timeout=10.0,
+            read_timeout=10.0,
+            write_timeout=10.0,
+        ))
+        .get_updates_request(HTTPXRequest(connection_pool_size=1))
+        .post_shutdown(_on_shutdown)
+        .build()
+    )
 
     # Register handlers
     app.add_handler(CommandHandler("start", cmd_start))
@@ -371,6 +569,12 @@ def main():
         )
         log.info(f"Scheduled scraping every {SCRAPE_INTERVAL // 60} minutes")
 
+    # Evict abandoned candidates so pending doesn't pin article dicts forever
+    app.job_queue.run_repeating(evict_stale_pending, interval=3600, first=3600)
+
+    # Write-behind flush of dirty pending entries to SQLite
+    app.job_queue.run_repeating(flush_pending_job, interval=0.5, first=0.5)
+
     log.info("Bot is running. Press Ctrl+C to stop.")
     app.run_polling(allowed_updates=Update.ALL_TYPES)
 
@@ -0,0 +1,32 @@
+"""
+jsonio.py — JSON helpers for the pipeline
+
+Uses orjson (C extension, SIMD number formatting) when available and
+falls back to the stdlib. dumps always returns str so callers can write
+to text files and SQLite TEXT columns unchanged.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # optional — stdlib json works, just slower
+    orjson = None
+
+
+if orjson is not None:
+
+    def dumps(obj, *, indent: bool = False) -> str:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode("utf-8")
+
+    def loads(data):
+        return orjson.loads(data)
+
+else:
+
+    def dumps(obj, *, indent: bool = False) -> str:
+        return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+
+    def loads(data):
+        return json.loads(data)
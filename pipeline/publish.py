@@ -10,7 +10,6 @@ Usage:
     echo '{"id": ...}' | python publish.py --stdin
 """
 
-import json
 import os
 import subprocess
 import sys
@@ -18,6 +17,13 @@ import tempfile
 from pathlib import Path
 from dotenv import load_dotenv
 
+import jsonio
+
+try:
+    import pygit2
+except ImportError:  # optional — subprocess git remains the fallback
+    pygit2 = None
+
 # Load .env from same directory
 load_dotenv(Path(__file__).parent / ".env")
 
@@ -25,6 +31,77 @@ TECH_PULSE_DIR = os.getenv("TECH_PULSE_DIR", str(Path(__file__).parent.parent))
 GIT_AUTO_PUSH = os.getenv("GIT_AUTO_PUSH", "true").lower() == "true"
 GIT_REMOTE = os.getenv("GIT_REMOTE", "origin")
 GIT_BRANCH = os.getenv("GIT_BRANCH", "main")
+GITHUB_TOKEN = os.getenv("GITHUB_TOKEN", "")
+USE_PYGIT2 = os.getenv("USE_PYGIT2", "true").lower() == "true"
+
+
+def _git_commit_push_pygit2(project_dir: Path, title_short: str) -> None:
+    """
+    Stage content/, commit, and push with in-process libgit2 calls.
+
+    Avoids three fork+exec round-trips per publish; the repo's index and
+    object db stay open across add -> commit -> push.
+    """
+    repo = pygit2.Repository(str(project_dir))
+
+    index = repo.index
+    index.add_all(["content/*"])
+    index.write()
+    tree = index.write_tree()
+
+    if tree == repo.head.peel(pygit2.Commit).tree_id:
+        print("WARNING: Git commit issue: nothing to commit", file=sys.stderr)
+        return
+
+    sig = repo.default_signature
+    repo.create_commit(
+        "HEAD", sig, sig, f"Add article: {title_short}", tree, [repo.head.target]
+    )
+    print(f"Committed: {title_short}")
+
+    callbacks = None
+    if GITHUB_TOKEN:
+        callbacks = pygit2.RemoteCallbacks(
+            credentials=pygit2.UserPass("x-access-token", GITHUB_TOKEN)
+        )
+    repo.remotes[GIT_REMOTE].push([f"refs/heads/{GIT_BRANCH}"], callbacks=callbacks)
+    print(f"Pushed to {GIT_REMOTE}/{GIT_BRANCH}")
+
+
+def _git_commit_push_subprocess(project_dir: Path, title_short: str) -> None:
+    """Stage content/, commit, and push by shelling out to git."""
+    subprocess.run(
+        ["git", "add", "content/"],
+        cwd=str(project_dir),
+        capture_output=True,
+        timeout=10,
+    )
+
+    commit_result = subprocess.run(
+        ["git", "commit", "-m", f"Add article: {title_short}"],
+        cwd=str(project_dir),
+        capture_output=True,
+        text=True,
+        timeout=10,
+    )
+
+    if commit_result.returncode != 0:
+        print(f"WARNING: Git commit issue: {commit_result.stderr}", file=sys.stderr)
+    else:
+        print(f"Committed: {title_short}")
+
+    push_result = subprocess.run(
+        ["git", "push", GIT_REMOTE, GIT_BRANCH],
+        cwd=str(project_dir),
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+
+    if push_result.returncode != 0:
+        print(f"WARNING: Git push issue: {push_result.stderr}", file=sys.stderr)
+    else:
+        print(f"Pushed to {GIT_REMOTE}/{GIT_BRANCH}")
 
 
 def publish_article(article_data: dict, push: bool = True) -> bool:
@@ -47,7 +124,7 @@ def publish_article(article_data: dict, push: bool = True) -> bool:
         mode="w", suffix=".json", delete=False, encoding="utf-8"
     )
     try:
-        json.dump(article_data, tmp, ensure_ascii=False, indent=2)
+        tmp.write(jsonio.dumps(article_data, indent=True))
         tmp.close()
 
         print(f"Publishing: {article_data.get('title', 'Unknown')}")
@@ -71,41 +148,13 @@ def publish_article(article_data: dict, push: bool = True) -> bool:
         if push and GIT_AUTO_PUSH:
             title_short = article_data.get("title", "article")[:60]
 
-            # Stage content files
-            subprocess.run(
-                ["git", "add", "content/"],
-                cwd=str(project_dir),
-                capture_output=True,
-                timeout=10,
-            )
-
-            # Commit
-            commit_result = subprocess.run(
-                ["git", "commit", "-m", f"Add article: {title_short}"],
-                cwd=str(project_dir),
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-
-            if commit_result.returncode != 0:
-                print(f"WARNING: Git commit issue: {commit_result.stderr}", file=sys.stderr)
-            else:
-                print(f"Committed: {title_short}")
-
-            # Push
-            push_result = subprocess.run(
-                ["git", "push", GIT_REMOTE, GIT_BRANCH],
-                cwd=str(project_dir),
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-
-            if push_result.returncode != 0:
-                print(f"WARNING: Git push issue: {push_result.stderr}", file=sys.stderr)
+            if USE_PYGIT2 and pygit2 is not None:
+                try:
+                    _git_commit_push_pygit2(project_dir, title_short)
+                except Exception as e:
+                    print(f"WARNING: pygit2 publish issue: {e}", file=sys.stderr)
             else:
-                print(f"Pushed to {GIT_REMOTE}/{GIT_BRANCH}")
+                _git_commit_push_subprocess(project_dir, title_short)
 
         print("SUCCESS: Article published!")
         return True
@@ -130,7 +179,7 @@ def read_input() -> dict:
 
     if "--stdin" in args:
         raw = sys.stdin.read()
-        return json.loads(raw)
+        return jsonio.loads(raw)
 
     if "--no-push" in args:
         args.remove("--no-push")
@@ -145,8 +194,8 @@ def read_input() -> dict:
         print(f"File not found: {file_path}", file=sys.stderr)
         sys.exit(1)
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(file_path, "rb") as f:
+        return jsonio.loads(f.read())
 
 
 if __name__ == "__main__":
@@ -13,27 +13,44 @@ Requires in .env:
     GITHUB_REPO  - Repository in format "username/repo-name"
 """
 
-import base64
-import json
+import asyncio
+import binascii
+import gzip
 import os
 import re
 import sys
+import time
 import unicodedata
 from datetime import datetime, timezone
 from pathlib import Path
 
-import requests
+import aiohttp
 from dotenv import load_dotenv
 
+import jsonio
+
 load_dotenv(Path(__file__).parent / ".env")
 
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN", "")
 GITHUB_REPO = os.getenv("GITHUB_REPO", "")  # e.g. "chagalj/tech-pulse"
 GITHUB_BRANCH = os.getenv("GIT_BRANCH", "main")
 GITHUB_API = "https://api.github.com"
+# Opt-in: GitHub's REST API does not document accepting compressed request
+# bodies, so only enable this after verifying it against the live API.
+ENABLE_GZIP_UPLOAD = os.getenv("ENABLE_GZIP_UPLOAD", "false").lower() == "true"
 
 VALID_CATEGORIES = ["ai", "gaming", "space", "technology", "medicine", "society", "robotics"]
 
+# Precompiled slug patterns — publish_to_github runs these on every article.
+_NON_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_NON_ID_RE = re.compile(r"[^a-z0-9-]+")
+
+
+def _ascii_fold(text: str) -> str:
+    """Decompose diacritics (š→s, č→c, ž→z, etc.) then drop combining marks."""
+    text = unicodedata.normalize("NFKD", text)
+    return text.encode("ascii", "ignore").decode("ascii")
+
 
 def _headers() -> dict:
     return {
@@ -43,6 +60,127 @@ def _headers() -> dict:
     }
 
 
+# ---------------------------------------------------------------------------
+# Shared HTTP session
+# ---------------------------------------------------------------------------
+_session: aiohttp.ClientSession | None = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Return the shared aiohttp session, creating it on first use.
+
+    One pool of keep-alive connections to api.github.com amortizes the TLS
+    handshake (2 RTTs + ~1 ms CPU) across the process lifetime; limit=20
+    gives the blob-upload fan-out room without opening a socket per call.
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=75),
+        )
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared aiohttp session (call on shutdown)."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+async def _request(method: str, url: str, **kwargs) -> aiohttp.ClientResponse:
+    """
+    Issue a GitHub API request, honouring rate-limit backoff.
+
+    Retries on 429 and on 403 secondary-rate-limit responses, sleeping for
+    Retry-After / X-RateLimit-Reset (or an exponential fallback) between
+    attempts instead of wasting quota on immediate retries.
+
+    JSON bodies are gzip-compressed when ENABLE_GZIP_UPLOAD=true —
+    base64-encoded MDX compresses ~4x, and compresslevel=1 is near-free.
+    """
+    headers = _headers()
+    payload = kwargs.pop("json", None)
+    if payload is not None:
+        if ENABLE_GZIP_UPLOAD:
+            kwargs["data"] = gzip.compress(
+                jsonio.dumps(payload).encode("utf-8"), compresslevel=1
+            )
+            headers["Content-Encoding"] = "gzip"
+            headers["Content-Type"] = "application/json"
+        else:
+            kwargs["json"] = payload
+
+    session = await get_session()
+    for attempt in range(5):
+        resp = await session.request(method, url, headers=headers, **kwargs)
+        limited = resp.status == 429 or (
+            resp.status == 403 and "rate limit" in (await resp.text()).lower()
+        )
+        if not limited or attempt == 4:
+            # Out of retries: hand the rate-limited response back intact
+            # (body unreleased) so callers can read it and report the
+            # failure normally.
+            return resp
+
+        if "Retry-After" in resp.headers:
+            wait = float(resp.headers["Retry-After"])
+        elif "X-RateLimit-Reset" in resp.headers:
+            wait = max(1.0, float(resp.headers["X-RateLimit-Reset"]) - time.time())
+        else:
+            wait = float(2 ** attempt)
+        resp.release()
+        await asyncio.sleep(wait)
+    return resp
+
+
+async def _error_message(resp: aiohttp.ClientResponse) -> str:
+    """Extract GitHub's error message from a failed response."""
+    text = await resp.text()
+    try:
+        return jsonio.loads(text).get("message", text[:200])
+    except ValueError:
+        return text[:200]
+
+
+# Precompiled MDX frontmatter templates + quote-escape table: generate_mdx
+# runs on every publish, so the invariant skeleton is built once here.
+_ESC = str.maketrans({'"': '\\"'})
+
+_MDX_TMPL = """\
+---
+id: "{id}"
+title: "{title}"
+category: "{category}"
+date: "{date}"
+excerpt: "{excerpt}"
+source:
+  name: "{source_name}"
+  url: "{source_url}"
+image:
+  url: "{image_url}"
+  alt: "{image_alt}"
+tags: [{tags}]
+{geo_block}featured: {featured}
+approved: true
+---
+
+{content}
+"""
+
+_GEO_TMPL = """\
+geo:
+  name: "{name}"
+  lat: {lat}
+  lon: {lon}
+  countryCode: "{countryCode}"
+"""
+
+_GEO_DEFAULT = _GEO_TMPL.format(name="Global", lat=0, lon=0, countryCode="XX")
+
+
 def generate_mdx(data: dict) -> str:
     """Convert article JSON to MDX frontmatter + content."""
     geo = data.get("geo") or {}
@@ -50,61 +188,154 @@ def generate_mdx(data: dict) -> str:
     image = data.get("image", {})
     tags = data.get("tags", [])
 
-    lines = [
-        "---",
-        f'id: "{data["id"]}"',
-        f'title: "{data["title"].replace(chr(34), chr(92)+chr(34))}"',
-        f'category: "{data["category"]}"',
-        f'date: "{data["date"]}"',
-        f'excerpt: "{data["excerpt"].replace(chr(34), chr(92)+chr(34))}"',
-        f"source:",
-        f'  name: "{source.get("name", "")}"',
-        f'  url: "{source.get("url", "")}"',
-        f"image:",
-        f'  url: "{image.get("url", "/images/articles/placeholder.jpg")}"',
-        f'  alt: "{image.get("alt", "Article image").replace(chr(34), chr(92)+chr(34))}"',
-        f'tags: [{", ".join(f"{chr(34)}{t}{chr(34)}" for t in tags)}]',
-    ]
-
     if geo and geo.get("lat") is not None:
-        lines += [
-            f"geo:",
-            f'  name: "{geo.get("name", "Global")}"',
-            f'  lat: {geo["lat"]}',
-            f'  lon: {geo["lon"]}',
-            f'  countryCode: "{geo.get("countryCode", "XX")}"',
-        ]
+        geo_block = _GEO_TMPL.format(
+            name=geo.get("name", "Global"),
+            lat=geo["lat"],
+            lon=geo["lon"],
+            countryCode=geo.get("countryCode", "XX"),
+        )
     else:
-        lines += [
-            f"geo:",
-            f'  name: "Global"',
-            f"  lat: 0",
-            f"  lon: 0",
-            f'  countryCode: "XX"',
-        ]
-
-    lines += [
-        f'featured: {str(data.get("featured", False)).lower()}',
-        f'approved: true',
-        "---",
-        "",
-        data.get("content", "").strip(),
-        "",
-    ]
+        geo_block = _GEO_DEFAULT
+
+    return _MDX_TMPL.format(
+        id=data["id"],
+        title=data["title"].translate(_ESC),
+        category=data["category"],
+        date=data["date"],
+        excerpt=data["excerpt"].translate(_ESC),
+        source_name=source.get("name", ""),
+        source_url=source.get("url", ""),
+        image_url=image.get("url", "/images/articles/placeholder.jpg"),
+        image_alt=image.get("alt", "Article image").translate(_ESC),
+        tags=", ".join(f'"{t}"' for t in tags),
+        geo_block=geo_block,
+        featured=str(data.get("featured", False)).lower(),
+        content=data.get("content", "").strip(),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Git Data API
+# ---------------------------------------------------------------------------
+
+# Last-known (head commit SHA, its tree SHA). We're normally the only writer,
+# so after a successful commit our own result is the next base — saving the
+# ref + commit GETs per publish. Invalidated when the ref update is rejected.
+_head_cache: tuple[str, str] | None = None
+_head_lock = asyncio.Lock()
+
 
-    return "\n".join(lines)
+async def _resolve_head() -> tuple[str, str]:
+    """Fetch the branch head commit SHA and its tree SHA."""
+    repo_url = f"{GITHUB_API}/repos/{GITHUB_REPO}"
 
+    resp = await _request("GET", f"{repo_url}/git/ref/heads/{GITHUB_BRANCH}")
+    if resp.status != 200:
+        raise RuntimeError(f"Ref lookup failed: {await _error_message(resp)}")
+    head_sha = (await resp.json())["object"]["sha"]
 
-def get_existing_file_sha(file_path: str) -> str | None:
-    """Check if file exists in repo and return its SHA (needed for updates)."""
-    url = f"{GITHUB_API}/repos/{GITHUB_REPO}/contents/{file_path}"
-    resp = requests.get(url, headers=_headers(), params={"ref": GITHUB_BRANCH})
-    if resp.status_code == 200:
-        return resp.json().get("sha")
-    return None
+    resp = await _request("GET", f"{repo_url}/git/commits/{head_sha}")
+    if resp.status != 200:
+        raise RuntimeError(f"Commit lookup failed: {await _error_message(resp)}")
+    return head_sha, (await resp.json())["tree"]["sha"]
 
 
-def publish_to_github(article: dict) -> dict:
+async def _create_blob(content: bytes) -> str:
+    """Upload one blob and return its SHA."""
+    url = f"{GITHUB_API}/repos/{GITHUB_REPO}/git/blobs"
+    payload = {
+        # b2a_base64 skips the extra copy base64.b64encode makes
+        "content": binascii.b2a_base64(content, newline=False).decode("ascii"),
+        "encoding": "base64",
+    }
+    resp = await _request("POST", url, json=payload)
+    if resp.status != 201:
+        raise RuntimeError(await _error_message(resp))
+    return (await resp.json())["sha"]
+
+
+async def _create_commit(files: list[tuple[str, bytes | None]], message: str) -> dict:
+    """
+    Commit a set of (path, content) files to the branch in one Git Data API
+    round: blobs -> tree (base_tree = head) -> commit -> ref fast-forward.
+    A content of None removes the path instead.
+
+    Tree merges are idempotent on path, so creating and updating a file are
+    the same operation and no prior existence check is needed; removing a
+    missing path surfaces as a tree-creation error rather than costing a
+    lookup round-trip up front.
+
+    Returns: {"success": bool, "message": str, "commit_sha": str}
+    """
+    global _head_cache
+    repo_url = f"{GITHUB_API}/repos/{GITHUB_REPO}"
+
+    # Upload all blobs concurrently (deletions have no blob)
+    try:
+        blob_shas = await asyncio.gather(
+            *(_create_blob(content) for _, content in files if content is not None)
+        )
+    except RuntimeError as exc:
+        return {"success": False, "message": f"Blob upload failed: {exc}"}
+
+    blob_iter = iter(blob_shas)
+    tree_entries = [
+        {
+            "path": path,
+            "mode": "100644",
+            "type": "blob",
+            "sha": next(blob_iter) if content is not None else None,
+        }
+        for path, content in files
+    ]
+
+    async with _head_lock:
+        for attempt in range(2):
+            try:
+                if _head_cache is None:
+                    _head_cache = await _resolve_head()
+            except RuntimeError as exc:
+                return {"success": False, "message": str(exc)}
+            head_sha, base_tree = _head_cache
+
+            # New tree on top of the current head
+            resp = await _request(
+                "POST",
+                f"{repo_url}/git/trees",
+                json={"base_tree": base_tree, "tree": tree_entries},
+            )
+            if resp.status != 201:
+                return {"success": False, "message": f"Tree creation failed: {await _error_message(resp)}"}
+            tree_sha = (await resp.json())["sha"]
+
+            # Commit and fast-forward the branch
+            resp = await _request(
+                "POST",
+                f"{repo_url}/git/commits",
+                json={"message": message, "tree": tree_sha, "parents": [head_sha]},
+            )
+            if resp.status != 201:
+                return {"success": False, "message": f"Commit creation failed: {await _error_message(resp)}"}
+            commit_sha = (await resp.json())["sha"]
+
+            resp = await _request(
+                "PATCH",
+                f"{repo_url}/git/refs/heads/{GITHUB_BRANCH}",
+                json={"sha": commit_sha},
+            )
+            if resp.status == 200:
+                _head_cache = (commit_sha, tree_sha)
+                return {"success": True, "message": message, "commit_sha": commit_sha}
+
+            if resp.status in (409, 422) and attempt == 0:
+                # Stale parent — someone else pushed. Re-fetch the head and retry.
+                _head_cache = None
+                continue
+            return {"success": False, "message": f"Ref update failed: {await _error_message(resp)}"}
+
+
+async def publish_to_github(article: dict) -> dict:
     """
     Publish an article by creating/updating an MDX file in the GitHub repo.
 
@@ -124,20 +355,14 @@ def publish_to_github(article: dict) -> dict:
     # Ensure ID exists — ASCII-only slug (strip diacritics: š→s, č→c, etc.)
     if not article.get("id"):
         date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        slug = article.get("title", "untitled").lower()
-        # Normalize unicode: decompose diacritics then strip combining marks
-        slug = unicodedata.normalize("NFKD", slug)
-        slug = slug.encode("ascii", "ignore").decode("ascii")
-        slug = re.sub(r"[^a-z0-9]+", "-", slug)
-        slug = slug.strip("-")[:60].rstrip("-")
-        article["id"] = f"{date_str}-{slug}"
+        slug = _ascii_fold(article.get("title", "untitled").lower())
+        slug = _NON_SLUG_RE.sub("-", slug)
+        article["id"] = f"{date_str}-{slug[:60].strip('-')}"
     else:
         # Also sanitize existing IDs that may contain non-ASCII
         old_id = article["id"]
-        sanitized = unicodedata.normalize("NFKD", old_id)
-        sanitized = sanitized.encode("ascii", "ignore").decode("ascii")
-        sanitized = re.sub(r"[^a-z0-9-]+", "-", sanitized.lower())
-        sanitized = sanitized.strip("-").rstrip("-")
+        sanitized = _NON_ID_RE.sub("-", _ascii_fold(old_id).lower())
+        sanitized = sanitized.strip("-")
         if sanitized != old_id:
             article["id"] = sanitized
 
@@ -149,76 +374,57 @@ def publish_to_github(article: dict) -> dict:
     mdx_content = generate_mdx(article)
     file_path = f"content/{category}/{article['id']}.mdx"
 
-    # Check if file exists (for update)
-    existing_sha = get_existing_file_sha(file_path)
-
-    # Create/update file via GitHub API
-    url = f"{GITHUB_API}/repos/{GITHUB_REPO}/contents/{file_path}"
-    payload = {
-        "message": f"Add article: {article['title'][:60]}",
-        "content": base64.b64encode(mdx_content.encode("utf-8")).decode("ascii"),
-        "branch": GITHUB_BRANCH,
-    }
+    # One Git Data API commit — no existence check, create and update are
+    # the same tree merge.
+    result = await _create_commit(
+        [(file_path, mdx_content.encode("utf-8"))],
+        f"Add article: {article['title'][:60]}",
+    )
 
-    if existing_sha:
-        payload["sha"] = existing_sha
-        payload["message"] = f"Update article: {article['title'][:60]}"
-
-    resp = requests.put(url, headers=_headers(), json=payload)
-
-    if resp.status_code in (200, 201):
-        file_url = resp.json().get("content", {}).get("html_url", "")
-        action = "Updated" if existing_sha else "Published"
+    if result["success"]:
         return {
             "success": True,
-            "message": f"{action}: {article['title']}",
-            "url": file_url,
+            "message": f"Published: {article['title']}",
+            "url": f"https://github.com/{GITHUB_REPO}/blob/{GITHUB_BRANCH}/{file_path}",
             "file_path": file_path,
         }
     else:
-        error = resp.json().get("message", resp.text[:200])
         return {
             "success": False,
-            "message": f"GitHub API error ({resp.status_code}): {error}",
+            "message": f"GitHub API error: {result['message']}",
             "url": "",
         }
 
 
-def delete_article(category: str, article_id: str) -> dict:
+async def delete_article(category: str, article_id: str) -> dict:
     """Delete an article from the repo."""
     file_path = f"content/{category}/{article_id}.mdx"
-    sha = get_existing_file_sha(file_path)
-
-    if not sha:
-        return {"success": False, "message": f"Article not found: {file_path}"}
-
-    url = f"{GITHUB_API}/repos/{GITHUB_REPO}/contents/{file_path}"
-    payload = {
-        "message": f"Remove article: {article_id}",
-        "sha": sha,
-        "branch": GITHUB_BRANCH,
-    }
+    result = await _create_commit([(file_path, None)], f"Remove article: {article_id}")
 
-    resp = requests.delete(url, headers=_headers(), json=payload)
-
-    if resp.status_code == 200:
+    if result["success"]:
         return {"success": True, "message": f"Deleted: {file_path}"}
-    else:
-        error = resp.json().get("message", resp.text[:200])
-        return {"success": False, "message": f"Delete failed: {error}"}
+    return {"success": False, "message": f"Delete failed: {result['message']}"}
+
+
+async def _list_category(cat: str) -> list[str]:
+    """List article files for one category, or [] if the request fails."""
+    url = f"{GITHUB_API}/repos/{GITHUB_REPO}/contents/content/{cat}"
+    resp = await _request("GET", url, params={"ref": GITHUB_BRANCH})
+    if resp.status != 200:
+        return []
+    return [
+        f"{cat}/{item['name']}"
+        for item in await resp.json()
+        if item["name"].endswith(".mdx")
+    ]
 
 
-def list_articles() -> list[str]:
-    """List all article files in the repo."""
-    articles = []
-    for cat in VALID_CATEGORIES:
-        url = f"{GITHUB_API}/repos/{GITHUB_REPO}/contents/content/{cat}"
-        resp = requests.get(url, headers=_headers(), params={"ref": GITHUB_BRANCH})
-        if resp.status_code == 200:
-            for item in resp.json():
-                if item["name"].endswith(".mdx"):
-                    articles.append(f"{cat}/{item['name']}")
-    return articles
+async def list_articles() -> list[str]:
+    """List all article files in the repo (one concurrent GET per category)."""
+    per_category = await asyncio.gather(
+        *(_list_category(cat) for cat in VALID_CATEGORIES)
+    )
+    return [article for articles in per_category for article in articles]
 
 
 # ---------------------------------------------------------------------------
@@ -228,21 +434,7 @@ def list_articles() -> list[str]:
 def read_input() -> dict:
     args = sys.argv[1:]
     if "--stdin" in args:
-        return json.loads(sys.stdin.read())
-    if "--list" in args:
-        print("Articles in repo:")
-        for a in list_articles():
-            print(f"  {a}")
-        sys.exit(0)
-    if "--delete" in args:
-        idx = args.index("--delete")
-        if idx + 2 < len(args):
-            result = delete_article(args[idx + 1], args[idx + 2])
-            print(result["message"])
-            sys.exit(0 if result["success"] else 1)
-        else:
-            print("Usage: --delete <category> <article-id>")
-            sys.exit(1)
+        return jsonio.loads(sys.stdin.buffer.read())
     if not args or args[0].startswith("-"):
         print("Usage:")
         print("  python publish_remote.py article.json    # Publish article")
@@ -251,14 +443,36 @@ def read_input() -> dict:
         print("  python publish_remote.py --delete ai my-article-id")
         sys.exit(1)
 
-    with open(args[0], "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(args[0], "rb") as f:
+        return jsonio.loads(f.read())
+
+
+async def _run_cli() -> int:
+    args = sys.argv[1:]
+    try:
+        if "--list" in args:
+            print("Articles in repo:")
+            for a in await list_articles():
+                print(f"  {a}")
+            return 0
+        if "--delete" in args:
+            idx = args.index("--delete")
+            if idx + 2 < len(args):
+                result = await delete_article(args[idx + 1], args[idx + 2])
+                print(result["message"])
+                return 0 if result["success"] else 1
+            print("Usage: --delete <category> <article-id>")
+            return 1
+
+        data = read_input()
+        result = await publish_to_github(data)
+        print(result["message"])
+        if result.get("url"):
+            print(f"URL: {result['url']}")
+        return 0 if result["success"] else 1
+    finally:
+        await close_session()
 
 
 if __name__ == "__main__":
-    data = read_input()
-    result = publish_to_github(data)
-    print(result["message"])
-    if result.get("url"):
-        print(f"URL: {result['url']}")
-    sys.exit(0 if result["success"] else 1)
+    sys.exit(asyncio.run(_run_cli()))
@@ -6,26 +6,47 @@ as tech news pieces, extracts geo data, and produces article candidates
 for editorial approval via Telegram.
 """
 
-import json
+import asyncio
+import hashlib
+import html
+import io
 import os
+import pickle
 import re
+import sqlite3
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
+from string import Template
+from xml.etree import ElementTree
 
 import feedparser
-from bs4 import BeautifulSoup
+import httpx
 from dotenv import load_dotenv
 from openai import OpenAI
 
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # optional — the regex stripper below covers RSS fragments
+    HTMLParser = None
+
+import jsonio
+
 # ---------------------------------------------------------------------------
 # Paths
 # ---------------------------------------------------------------------------
 PIPELINE_DIR = Path(__file__).resolve().parent
 SOURCES_FILE = PIPELINE_DIR / "rss_sources.json"
 GEO_MAP_FILE = PIPELINE_DIR / "geo_map.json"
-SEEN_FILE = PIPELINE_DIR / "seen_articles.json"
+GEO_MAP_CACHE_FILE = PIPELINE_DIR / "geo_map.cache.pkl"
+SEEN_FILE = PIPELINE_DIR / "seen_articles.txt"
+LEGACY_SEEN_FILE = PIPELINE_DIR / "seen_articles.json"
+ETAGS_FILE = PIPELINE_DIR / "feed_etags.json"
+LLM_CACHE_FILE = PIPELINE_DIR / "llm_cache.sqlite"
 ENV_FILE = PIPELINE_DIR / ".env"
 
 # Load environment variables from the pipeline directory
@@ -43,42 +64,122 @@ VALID_CATEGORIES = ["ai", "gaming", "space", "technology", "medicine", "society"
 def load_sources() -> list[dict]:
     """Load RSS source configurations from rss_sources.json."""
     try:
-        with open(SOURCES_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(SOURCES_FILE, "rb") as f:
+            data = jsonio.loads(f.read())
         return data.get("sources", [])
-    except (FileNotFoundError, json.JSONDecodeError) as exc:
+    except (FileNotFoundError, ValueError) as exc:
         print(f"[scraper] Error loading sources: {exc}", file=sys.stderr)
         return []
 
 
+# The map returned on load failure, and the in-memory (mtime, dict) of the
+# last successful load. Holding the last map and handing the *same* object
+# back while the file is unchanged keeps dict identity stable, which the
+# id()-keyed memos downstream (_geo_matcher, the locations hint) rely on —
+# without it, CPython can reuse a freed map's address for the next load and
+# silently serve stale derived state.
+_EMPTY_GEO_MAP: dict = {"known_locations": {}, "company_hq": {}}
+_geo_map_cache: tuple[float, dict] | None = None
+
+
 def load_geo_map() -> dict:
-    """Load known geo locations and company HQ mappings from geo_map.json."""
+    """
+    Load known geo locations and company HQ mappings from geo_map.json.
+
+    The parsed map is cached in memory, and as a pickle next to the
+    JSON, keyed by the source file's mtime; while geo_map.json is
+    unchanged, callers get the same dict object back and the parse is
+    skipped. Both caches are best-effort: any problem with them just
+    falls through to the normal parse.
+    """
+    global _geo_map_cache
+
+    try:
+        mtime = os.stat(GEO_MAP_FILE).st_mtime
+    except OSError as exc:
+        print(f"[scraper] Error loading geo map: {exc}", file=sys.stderr)
+        return _EMPTY_GEO_MAP
+
+    if _geo_map_cache is not None and _geo_map_cache[0] == mtime:
+        return _geo_map_cache[1]
+
+    try:
+        with open(GEO_MAP_CACHE_FILE, "rb") as f:
+            cached_mtime, geo_map = pickle.load(f)
+        if cached_mtime == mtime:
+            _geo_map_cache = (mtime, geo_map)
+            return geo_map
+    except Exception:
+        pass
+
     try:
-        with open(GEO_MAP_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError) as exc:
+        with open(GEO_MAP_FILE, "rb") as f:
+            geo_map = jsonio.loads(f.read())
+    except (FileNotFoundError, ValueError) as exc:
         print(f"[scraper] Error loading geo map: {exc}", file=sys.stderr)
-        return {"known_locations": {}, "company_hq": {}}
+        return _EMPTY_GEO_MAP
+
+    _geo_map_cache = (mtime, geo_map)
+
+    try:
+        with open(GEO_MAP_CACHE_FILE, "wb") as f:
+            pickle.dump((mtime, geo_map), f, pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+    return geo_map
 
 
 def load_seen() -> set[str]:
-    """Load set of previously-seen article URLs from seen_articles.json."""
+    """Load set of previously-seen article URLs from seen_articles.txt."""
+    try:
+        return set(SEEN_FILE.read_text(encoding="utf-8").splitlines())
+    except FileNotFoundError:
+        pass
+
+    # One-time migration from the old JSON-list format.
     try:
-        with open(SEEN_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return set(data)
+        with open(LEGACY_SEEN_FILE, "rb") as f:
+            seen = set(jsonio.loads(f.read()))
     except FileNotFoundError:
         return set()
-    except json.JSONDecodeError as exc:
+    except ValueError as exc:
         print(f"[scraper] Error loading seen articles: {exc}", file=sys.stderr)
         return set()
 
+    append_seen(sorted(seen))
+    return seen
 
-def save_seen(seen: set[str]) -> None:
-    """Persist the set of seen article URLs to seen_articles.json."""
+
+def load_etags() -> dict:
+    """Load per-feed ETag / Last-Modified validators from feed_etags.json."""
+    try:
+        with open(ETAGS_FILE, "rb") as f:
+            return jsonio.loads(f.read())
+    except FileNotFoundError:
+        return {}
+    except ValueError as exc:
+        print(f"[scraper] Error loading feed etags: {exc}", file=sys.stderr)
+        return {}
+
+
+def save_etags(etags: dict) -> None:
+    """Persist per-feed ETag / Last-Modified validators to feed_etags.json."""
     try:
-        with open(SEEN_FILE, "w", encoding="utf-8") as f:
-            json.dump(sorted(seen), f, indent=2, ensure_ascii=False)
+        # Machine-only file — compact output, no pretty-printing overhead.
+        with open(ETAGS_FILE, "w", encoding="utf-8") as f:
+            f.write(jsonio.dumps(etags))
+    except OSError as exc:
+        print(f"[scraper] Error saving feed etags: {exc}", file=sys.stderr)
+
+
+def append_seen(links: list[str]) -> None:
+    """Append newly-seen article URLs to seen_articles.txt, one per line."""
+    if not links:
+        return
+    try:
+        with open(SEEN_FILE, "a", encoding="utf-8") as f:
+            f.writelines(link + "\n" for link in links)
     except OSError as exc:
         print(f"[scraper] Error saving seen articles: {exc}", file=sys.stderr)
 
@@ -87,12 +188,18 @@ def save_seen(seen: set[str]) -> None:
 # Feed scraping
 # ---------------------------------------------------------------------------
 
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
 def _clean_html(raw_html: str) -> str:
     """Strip HTML tags and return plain text."""
     if not raw_html:
         return ""
-    soup = BeautifulSoup(raw_html, "html.parser")
-    return soup.get_text(separator=" ", strip=True)
+    if HTMLParser is not None:
+        text = HTMLParser(raw_html).text(separator=" ", strip=True)
+    else:
+        text = html.unescape(_TAG_RE.sub(" ", raw_html))
+    return " ".join(text.split())
 
 
 def _parse_published(entry) -> str:
@@ -108,69 +215,378 @@ def _parse_published(entry) -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _parse_date_str(raw: str) -> str:
+    """Normalise an RSS (RFC 822) or Atom (ISO 8601) date to ISO-8601, or now."""
+    raw = raw.strip()
+    if raw:
+        try:
+            return parsedate_to_datetime(raw).isoformat()
+        except ValueError:
+            pass
+        try:
+            return datetime.fromisoformat(raw.replace("Z", "+00:00")).isoformat()
+        except ValueError:
+            pass
+    return datetime.now(timezone.utc).isoformat()
+
+
+FETCH_TIMEOUT = 10  # seconds — one slow feed must not stall the whole pool
+
+
+def _fast_parse(body: bytes) -> list[dict]:
+    """
+    Minimal RSS/Atom item extraction via the C-accelerated ElementTree
+    parser — we only need four fields, not feedparser's exhaustive
+    format detection and sanitization. Returns normalised entry dicts;
+    raises ElementTree.ParseError on malformed XML.
+    """
+    entries: list[dict] = []
+    for _event, elem in ElementTree.iterparse(io.BytesIO(body)):
+        tag = elem.tag.rsplit("}", 1)[-1]
+        if tag not in ("item", "entry"):
+            continue
+
+        title = link = summary = published = ""
+        for child in elem:
+            ctag = child.tag.rsplit("}", 1)[-1]
+            text = (child.text or "").strip()
+            if ctag == "title" and not title:
+                title = text
+            elif ctag == "link" and not link:
+                # RSS puts the URL in the text, Atom in an href attribute.
+                if child.get("rel") in (None, "alternate"):
+                    link = text or child.get("href", "")
+            elif ctag in ("description", "summary") and not summary:
+                summary = text
+            elif ctag in ("pubDate", "published", "updated") and not published:
+                published = text
+
+        entries.append({
+            "title": title or "Untitled",
+            "link": link,
+            "summary": summary,
+            "published": _parse_date_str(published),
+        })
+        elem.clear()
+    return entries
+
+
+def _parse_feed_body(body: bytes) -> list[dict]:
+    """Parse a fetched feed body into normalised entry dicts."""
+    try:
+        return _fast_parse(body)
+    except ElementTree.ParseError:
+        pass
+
+    # Malformed XML — fall back to feedparser's tolerant heuristics.
+    feed = feedparser.parse(body)
+    return [
+        {
+            "title": getattr(entry, "title", "Untitled"),
+            "link": getattr(entry, "link", ""),
+            "summary": getattr(entry, "summary", "") or getattr(entry, "description", ""),
+            "published": _parse_published(entry),
+        }
+        for entry in feed.entries
+    ]
+
+
+async def _fetch_feed(client: httpx.AsyncClient, url: str, etags: dict) -> list[dict]:
+    """
+    Fetch one feed and parse it off the event loop.
+
+    Sends the validators remembered from the previous run; a 304 response
+    means nothing changed, so the body download and parse are skipped
+    entirely. New validators are written back into `etags` (safe without a
+    lock — all fetches share one event loop thread).
+    """
+    cached = etags.get(url, {})
+    headers = {}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    resp = await client.get(url, headers=headers)
+    if resp.status_code == 304:
+        return []
+    resp.raise_for_status()
+
+    validators = {}
+    if resp.headers.get("ETag"):
+        validators["etag"] = resp.headers["ETag"]
+    if resp.headers.get("Last-Modified"):
+        validators["last_modified"] = resp.headers["Last-Modified"]
+    if validators:
+        etags[url] = validators
+
+    return await asyncio.to_thread(_parse_feed_body, resp.content)
+
+
+async def _scrape_feeds_async(sources: list[dict]) -> list:
+    """
+    Fetch all feeds concurrently over one shared client. Returns one
+    result per source, in order; failures come back as exceptions.
+    """
+    try:
+        import h2  # noqa: F401 — required by httpx for http2=True
+        http2 = True
+    except ImportError:
+        http2 = False
+    try:
+        import brotli  # noqa: F401 — required by httpx to decode br
+        accept_encoding = "gzip, br"
+    except ImportError:
+        accept_encoding = "gzip"
+
+    etags = load_etags()
+    async with httpx.AsyncClient(
+        http2=http2,
+        timeout=FETCH_TIMEOUT,
+        follow_redirects=True,
+        headers={
+            "Accept-Encoding": accept_encoding,
+            "User-Agent": "TechPulse/1.0",
+        },
+    ) as client:
+        results = await asyncio.gather(
+            *(_fetch_feed(client, source["url"], etags) for source in sources),
+            return_exceptions=True,
+        )
+    save_etags(etags)
+    return results
+
+
 def scrape_feeds() -> list[dict]:
     """
-    Parse all configured RSS feeds and return a list of *new* raw entries
-    (those not already in the seen set).
+    Fetch all configured RSS feeds concurrently and return a list of *new*
+    raw entries (those not already in the seen set).
+
+    Fetches run as async GETs on one event loop with a shared connection
+    pool (wall time is roughly the slowest feed instead of the sum of all
+    round-trips); parsing happens off-loop and the seen-set updates stay
+    on the calling thread.
 
     Each entry dict contains:
         source_name, source_url, title, link, published, summary
     """
-    sources = load_sources()
+    sources = [s for s in load_sources() if s.get("url")]
     seen = load_seen()
     new_entries: list[dict] = []
 
-    for source in sources:
+    if not sources:
+        print("[scraper] No sources configured.", file=sys.stderr)
+        return new_entries
+
+    results = asyncio.run(_scrape_feeds_async(sources))
+
+    for source, result in zip(sources, results):
         name = source.get("name", "Unknown")
-        url = source.get("url", "")
-        if not url:
-            continue
+        url = source["url"]
 
-        print(f"[scraper] Fetching {name}: {url}", file=sys.stderr)
-        try:
-            feed = feedparser.parse(url)
-        except Exception as exc:
-            print(f"[scraper] Failed to parse {name}: {exc}", file=sys.stderr)
+        if isinstance(result, BaseException):
+            print(f"[scraper] Failed to fetch {name}: {result}", file=sys.stderr)
             continue
 
-        for entry in feed.entries:
-            link = getattr(entry, "link", "")
+        print(f"[scraper] Fetched {name}: {url}", file=sys.stderr)
+        for entry in result:
+            link = entry["link"]
             if not link or link in seen:
                 continue
 
-            summary_raw = getattr(entry, "summary", "") or getattr(entry, "description", "")
-            summary = _clean_html(summary_raw)
+            # Bound the stripper's input: we keep at most 2000 chars of text,
+            # so cleaning a multi-KB summary past ~4x tag overhead is waste.
+            summary = _clean_html(entry["summary"][:8000])
 
             new_entries.append({
                 "source_name": name,
                 "source_url": url,
-                "title": getattr(entry, "title", "Untitled"),
+                "title": entry["title"],
                 "link": link,
-                "published": _parse_published(entry),
+                "published": entry["published"],
                 "summary": summary[:2000],  # cap at 2000 chars for the prompt
             })
 
             # Mark as seen immediately to avoid duplicates within the same run
             seen.add(link)
 
-    # Persist updated seen set
-    save_seen(seen)
+    # Persist only this run's additions; the file is append-only.
+    append_seen([entry["link"] for entry in new_entries])
     print(f"[scraper] Found {len(new_entries)} new articles across all feeds.", file=sys.stderr)
     return new_entries
 
 
+# ---------------------------------------------------------------------------
+# LLM response cache
+# ---------------------------------------------------------------------------
+# Re-running the scraper over entries that were processed before (e.g. after
+# a crash, or a candidate that never got approved) re-bought the exact same
+# completion. Cache parsed responses on disk keyed by the full prompt, with
+# a TTL so stale rewrites age out.
+
+LLM_CACHE_TTL = 7 * 24 * 3600  # seconds
+
+_llm_cache_db: sqlite3.Connection | None = None
+_llm_cache_lock = threading.Lock()
+
+
+def _llm_cache() -> sqlite3.Connection:
+    global _llm_cache_db
+    if _llm_cache_db is None:
+        db = sqlite3.connect(
+            str(LLM_CACHE_FILE), isolation_level=None, check_same_thread=False
+        )
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, ts INTEGER NOT NULL)"
+        )
+        _llm_cache_db = db
+    return _llm_cache_db
+
+
+def _cache_key(system_prompt: str, user_prompt: str) -> str:
+    payload = (OPENAI_MODEL + system_prompt + user_prompt).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _cache_get(key: str) -> dict | None:
+    with _llm_cache_lock:
+        row = _llm_cache().execute(
+            "SELECT value, ts FROM cache WHERE key = ?", (key,)
+        ).fetchone()
+    if not row or time.time() - row[1] > LLM_CACHE_TTL:
+        return None
+    return jsonio.loads(row[0])
+
+
+def _cache_put(key: str, result: dict) -> None:
+    with _llm_cache_lock:
+        _llm_cache().execute(
+            "INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, ?, ?)",
+            (key, jsonio.dumps(result), int(time.time())),
+        )
+
+
 # ---------------------------------------------------------------------------
 # OpenAI article processing
 # ---------------------------------------------------------------------------
 
+# One client (and one warm connection pool) shared by all worker threads —
+# constructing OpenAI() per article paid a fresh TCP+TLS handshake before
+# every request. HTTP/2 multiplexing is enabled when the optional h2
+# package is installed.
+_openai_client: OpenAI | None = None
+_openai_client_lock = threading.Lock()
+
+
+def _get_openai_client() -> OpenAI:
+    """Return the shared OpenAI client, creating it on first use."""
+    global _openai_client
+    with _openai_client_lock:
+        if _openai_client is None:
+            try:
+                import h2  # noqa: F401 — required by httpx for http2=True
+                http2 = True
+            except ImportError:
+                http2 = False
+            _openai_client = OpenAI(
+                api_key=OPENAI_API_KEY,
+                http_client=httpx.Client(
+                    http2=http2,
+                    limits=httpx.Limits(max_keepalive_connections=20),
+                ),
+            )
+    return _openai_client
+
+
+# Memoized like _geo_lookups: the hint only depends on geo_map, which is
+# loaded once per run but was re-joined for every article.
+_locations_hint_cache: tuple[int, str] | None = None
+
+
 def _build_known_locations_hint(geo_map: dict) -> str:
     """Build a compact hint string of known location names for the prompt."""
-    names = list(geo_map.get("known_locations", {}).keys())
-    companies = list(geo_map.get("company_hq", {}).keys())
-    return (
-        "Known locations: " + ", ".join(names) + "\n"
-        "Known company HQs: " + ", ".join(f"{c} -> {geo_map['company_hq'][c]}" for c in companies)
-    )
+    global _locations_hint_cache
+    if _locations_hint_cache is None or _locations_hint_cache[0] != id(geo_map):
+        names = list(geo_map.get("known_locations", {}).keys())
+        companies = list(geo_map.get("company_hq", {}).keys())
+        hint = (
+            "Known locations: " + ", ".join(names) + "\n"
+            "Known company HQs: " + ", ".join(f"{c} -> {geo_map['company_hq'][c]}" for c in companies)
+        )
+        _locations_hint_cache = (id(geo_map), hint)
+    return _locations_hint_cache[1]
+
+
+# The invariant instructions come first and the per-entry fields last so that
+# every request shares the same prompt prefix. OpenAI's automatic prompt cache
+# matches on prefixes, so a stable prefix gets the instructions (and system
+# prompt) served from cache instead of re-billed on every article.
+_USER_PROMPT_TMPL = Template("""Rewrite the RSS feed entry at the end of this message as a Tech Pulse article.
+
+INSTRUCTIONS:
+1. Choose the single best category from: $categories
+2. Write a new, compelling headline (title).
+3. Write an excerpt of max 250 characters summarising the key point.
+4. Write the full article as 400-700 words in Markdown. Be factual and informative.
+   Do NOT copy the original text verbatim - rewrite it in your own words.
+   Use subheadings (##) where appropriate.
+5. Include 3-5 relevant hyperlinks in the article body where appropriate.
+   - Link to official websites, product pages, company sites, event pages, etc.
+   - Use standard Markdown link syntax: [text](url)
+   - Only use real, well-known URLs (e.g. official company sites, Wikipedia for concepts)
+   - Don't link every word - be selective and natural
+6. Generate 3-7 relevant tags (lowercase, no hashes).
+7. Determine the primary geographic location relevant to this story.
+   $locations_hint
+   If the article mentions a known company, map it to the company HQ.
+   If you can identify a location, provide name, lat, lon, countryCode.
+   If no location is relevant, set geo to null.
+
+Respond with a single JSON object in this exact schema:
+{
+  "category": "string",
+  "title": "string",
+  "excerpt": "string",
+  "content": "string (markdown)",
+  "tags": ["string"],
+  "geo": { "name": "string", "lat": number, "lon": number, "countryCode": "string" } | null
+}
+
+ENTRY:
+SOURCE: $source_name
+TITLE: $title
+LINK: $link
+PUBLISHED: $published
+SUMMARY:
+$summary""")
+
+
+# Single-scan matcher over all location and company names, rebuilt only when
+# a new geo_map object is loaded. The old per-article loops were two O(map
+# size) substring scans with a .lower() per key; one alternation pass over
+# the candidate name scales with the name length instead. Alternatives are
+# sorted longest-first so the most specific name wins at any position, and
+# locations are registered before companies so they win length ties.
+_geo_matcher_cache: tuple[int, re.Pattern | None, dict] | None = None
+
+
+def _geo_matcher(geo_map: dict) -> tuple[re.Pattern | None, dict]:
+    """Return (pattern, payloads) matching any known geo name, lowercased."""
+    global _geo_matcher_cache
+    if _geo_matcher_cache is None or _geo_matcher_cache[0] != id(geo_map):
+        payloads: dict = {}
+        for key, loc in geo_map.get("known_locations", {}).items():
+            payloads.setdefault(key.lower(), ("loc", loc))
+        for company, hq_key in geo_map.get("company_hq", {}).items():
+            payloads.setdefault(company.lower(), ("hq", hq_key))
+        pattern = None
+        if payloads:
+            names = sorted(payloads, key=len, reverse=True)
+            pattern = re.compile("|".join(re.escape(name) for name in names))
+        _geo_matcher_cache = (id(geo_map), pattern, payloads)
+    return _geo_matcher_cache[1], _geo_matcher_cache[2]
 
 
 def _resolve_geo(geo_raw: dict | None, geo_map: dict) -> dict | None:
@@ -181,24 +597,21 @@ def _resolve_geo(geo_raw: dict | None, geo_map: dict) -> dict | None:
     if not geo_raw or not isinstance(geo_raw, dict):
         return None
 
-    geo_name = geo_raw.get("name", "")
+    geo_name_lc = geo_raw.get("name", "").lower()
     known = geo_map.get("known_locations", {})
-    company_hq = geo_map.get("company_hq", {})
-
-    # Check if the name directly matches a known location key
-    for key, loc in known.items():
-        if key.lower() in geo_name.lower():
-            return {
-                "name": loc["name"],
-                "lat": loc["lat"],
-                "lon": loc["lon"],
-                "countryCode": loc["countryCode"],
-            }
-
-    # Check if a known company name appears in the geo name
-    for company, hq_key in company_hq.items():
-        if company.lower() in geo_name.lower() and hq_key in known:
-            loc = known[hq_key]
+    pattern, payloads = _geo_matcher(geo_map)
+
+    # One scan over the name; keep the longest known name that appears.
+    best = None
+    if pattern is not None:
+        for match in pattern.finditer(geo_name_lc):
+            if best is None or len(match.group()) > len(best):
+                best = match.group()
+
+    if best is not None:
+        kind, payload = payloads[best]
+        loc = payload if kind == "loc" else known.get(payload)
+        if loc is not None:
             return {
                 "name": loc["name"],
                 "lat": loc["lat"],
@@ -231,7 +644,7 @@ def process_article(entry: dict, geo_map: dict) -> dict | None:
         print("[scraper] OPENAI_API_KEY not set. Skipping article.", file=sys.stderr)
         return None
 
-    client = OpenAI(api_key=OPENAI_API_KEY)
+    client = _get_openai_client()
 
     locations_hint = _build_known_locations_hint(geo_map)
 
@@ -242,63 +655,44 @@ def process_article(entry: dict, geo_map: dict) -> dict | None:
         "Always write in English."
     )
 
-    user_prompt = f"""Rewrite the following RSS feed entry as a Tech Pulse article.
-
-SOURCE: {entry['source_name']}
-TITLE: {entry['title']}
-LINK: {entry['link']}
-PUBLISHED: {entry['published']}
-SUMMARY:
-{entry['summary']}
-
-INSTRUCTIONS:
-1. Choose the single best category from: {', '.join(VALID_CATEGORIES)}
-2. Write a new, compelling headline (title).
-3. Write an excerpt of max 250 characters summarising the key point.
-4. Write the full article as 400-700 words in Markdown. Be factual and informative.
-   Do NOT copy the original text verbatim - rewrite it in your own words.
-   Use subheadings (##) where appropriate.
-5. Include 3-5 relevant hyperlinks in the article body where appropriate.
-   - Link to official websites, product pages, company sites, event pages, etc.
-   - Use standard Markdown link syntax: [text](url)
-   - Only use real, well-known URLs (e.g. official company sites, Wikipedia for concepts)
-   - Don't link every word - be selective and natural
-6. Generate 3-7 relevant tags (lowercase, no hashes).
-7. Determine the primary geographic location relevant to this story.
-   {locations_hint}
-   If the article mentions a known company, map it to the company HQ.
-   If you can identify a location, provide name, lat, lon, countryCode.
-   If no location is relevant, set geo to null.
+    user_prompt = _USER_PROMPT_TMPL.substitute(
+        categories=", ".join(VALID_CATEGORIES),
+        locations_hint=locations_hint,
+        source_name=entry["source_name"],
+        title=entry["title"],
+        link=entry["link"],
+        published=entry["published"],
+        summary=entry["summary"],
+    )
 
-Respond with ONLY valid JSON (no markdown fences) in this exact schema:
-{{
-  "category": "string",
-  "title": "string",
-  "excerpt": "string",
-  "content": "string (markdown)",
-  "tags": ["string"],
-  "geo": {{ "name": "string", "lat": number, "lon": number, "countryCode": "string" }} | null
-}}"""
+    cache_key = _cache_key(system_prompt, user_prompt)
 
     try:
-        response = client.chat.completions.create(
-            model=OPENAI_MODEL,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            temperature=0.7,
-            max_tokens=2000,
-        )
-
-        raw_text = response.choices[0].message.content.strip()
-
-        # Strip markdown code fences if the model wrapped the JSON
-        if raw_text.startswith("```"):
-            raw_text = re.sub(r"^```(?:json)?\s*", "", raw_text)
-            raw_text = re.sub(r"\s*```$", "", raw_text)
-
-        result = json.loads(raw_text)
+        result = _cache_get(cache_key)
+        if result is None:
+            # Stream the completion: tokens are consumed as they decode
+            # instead of holding the connection idle until the full
+            # response is buffered server-side.
+            response = client.chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                temperature=0.7,
+                max_tokens=2000,
+                stream=True,
+                response_format={"type": "json_object"},
+            )
+
+            buf = []
+            for chunk in response:
+                if chunk.choices:
+                    buf.append(chunk.choices[0].delta.content or "")
+            raw_text = "".join(buf).strip()
+
+            result = jsonio.loads(raw_text)
+            _cache_put(cache_key, result)
 
         # Validate category
         category = result.get("category", "technology").lower()
@@ -330,7 +724,7 @@ Respond with ONLY valid JSON (no markdown fences) in this exact schema:
             "geo": geo,
         }
 
-    except json.JSONDecodeError as exc:
+    except ValueError as exc:
         print(
             f"[scraper] JSON parse error for '{entry['title']}': {exc}",
             file=sys.stderr,
@@ -348,29 +742,78 @@ Respond with ONLY valid JSON (no markdown fences) in this exact schema:
 # Main entry point
 # ---------------------------------------------------------------------------
 
+OPENAI_MAX_WORKERS = 6
+OPENAI_CALLS_PER_MINUTE = 60
+
+
+class _RateLimiter:
+    """Thread-safe token bucket pacing OpenAI calls across the worker pool."""
+
+    def __init__(self, calls_per_minute: int, burst: int):
+        self._rate = calls_per_minute / 60.0
+        self._capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a call token is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated) * self._rate,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
 def get_candidates() -> list[dict]:
     """
     Main entry point. Scrapes all configured RSS feeds, processes new articles
-    through OpenAI, and returns a list of article candidate dicts ready for
-    Telegram approval.
+    through OpenAI concurrently, and returns a list of article candidate dicts
+    ready for Telegram approval.
     """
     geo_map = load_geo_map()
     entries = scrape_feeds()
 
-    candidates: list[dict] = []
+    if not entries:
+        print("[scraper] Produced 0 candidates from 0 new articles.", file=sys.stderr)
+        return []
 
-    for i, entry in enumerate(entries, start=1):
-        print(
-            f"[scraper] Processing {i}/{len(entries)}: {entry['title'][:80]}",
-            file=sys.stderr,
-        )
-        candidate = process_article(entry, geo_map)
-        if candidate:
-            candidates.append(candidate)
+    # The rewrite calls are pure network wait, so run them across a small
+    # pool; the token bucket keeps the aggregate request rate polite instead
+    # of sleeping a fixed second between articles.
+    limiter = _RateLimiter(OPENAI_CALLS_PER_MINUTE, burst=OPENAI_MAX_WORKERS)
+
+    def _process(entry: dict) -> dict | None:
+        limiter.acquire()
+        return process_article(entry, geo_map)
 
-        # Small delay to respect rate limits
-        if i < len(entries):
-            time.sleep(1)
+    candidates: list[dict] = []
+    with ThreadPoolExecutor(max_workers=min(OPENAI_MAX_WORKERS, len(entries))) as pool:
+        futures = {pool.submit(_process, entry): entry for entry in entries}
+        for done, future in enumerate(as_completed(futures), start=1):
+            entry = futures[future]
+            print(
+                f"[scraper] Processed {done}/{len(entries)}: {entry['title'][:80]}",
+                file=sys.stderr,
+            )
+            try:
+                candidate = future.result()
+            except Exception as exc:
+                print(
+                    f"[scraper] Processing failed for '{entry['title']}': {exc}",
+                    file=sys.stderr,
+                )
+                continue
+            if candidate:
+                candidates.append(candidate)
 
     print(f"[scraper] Produced {len(candidates)} candidates from {len(entries)} new articles.", file=sys.stderr)
     return candidates
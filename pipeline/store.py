@@ -0,0 +1,121 @@
+"""
+store.py — Durable state for the Tech Pulse bot
+
+SQLite-backed persistence for the bot's `pending` and `published` stores
+so a restart doesn't lose candidates awaiting approval or the publish
+history. WAL mode with synchronous=NORMAL keeps writes cheap — the state
+is reconstructible from a re-scrape, so a full fsync per write isn't
+worth the latency.
+"""
+
+import hashlib
+import math
+import sqlite3
+import time
+from pathlib import Path
+
+import jsonio
+
+DEFAULT_DB = Path(__file__).resolve().parent / "state.db"
+
+
+class BloomFilter:
+    """
+    Small dependency-free Bloom filter (blake2b double hashing).
+
+    Hits may be false at ~error_rate but misses are definitive — the safe
+    direction for dedup, since the worst case is skipping an article that
+    merely looks like a repeat. ~180 KB at the default sizing.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001):
+        # Standard sizing: m = -n*ln(p)/ln(2)^2, k = (m/n)*ln(2)
+        m = int(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self._m = m
+        self._k = max(1, round(m / capacity * math.log(2)))
+        self._bits = bytearray((m + 7) // 8)
+
+    def _indexes(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little")
+        return ((h1 + i * h2) % self._m for i in range(self._k))
+
+    def add(self, item: str) -> None:
+        for idx in self._indexes(item):
+            self._bits[idx >> 3] |= 1 << (idx & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[idx >> 3] & (1 << (idx & 7)) for idx in self._indexes(item)
+        )
+
+
+class Store:
+    """WAL-mode SQLite store for pending candidates and published titles."""
+
+    def __init__(self, db_path: Path | str = DEFAULT_DB):
+        self.path = Path(db_path)
+        self._db = sqlite3.connect(
+            str(self.path), isolation_level=None, check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS pending ("
+            "id TEXT PRIMARY KEY, json TEXT NOT NULL, ts INTEGER NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS published ("
+            "title TEXT PRIMARY KEY, ts INTEGER NOT NULL)"
+        )
+
+    # -- pending candidates -------------------------------------------------
+
+    def put_pending(self, article_id: str, article: dict) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO pending (id, json, ts) VALUES (?, ?, ?)",
+            (article_id, jsonio.dumps(article), int(time.time())),
+        )
+
+    def put_pending_many(self, items: list[tuple[str, dict]]) -> None:
+        """Batch-insert pending candidates in a single transaction."""
+        now = int(time.time())
+        self._db.executemany(
+            "INSERT OR REPLACE INTO pending (id, json, ts) VALUES (?, ?, ?)",
+            [
+                (article_id, jsonio.dumps(article), now)
+                for article_id, article in items
+            ],
+        )
+
+    def delete_pending(self, article_id: str) -> None:
+        self._db.execute("DELETE FROM pending WHERE id = ?", (article_id,))
+
+    def load_pending(self) -> dict[str, dict]:
+        """Return all persisted pending candidates as {id: article}."""
+        rows = self._db.execute("SELECT id, json FROM pending ORDER BY ts").fetchall()
+        return {article_id: jsonio.loads(raw) for article_id, raw in rows}
+
+    # -- published titles ---------------------------------------------------
+
+    def add_published(self, title: str) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO published (title, ts) VALUES (?, ?)",
+            (title, int(time.time())),
+        )
+
+    def all_published_titles(self) -> list[str]:
+        """Return every published title (for seeding the dedup Bloom filter)."""
+        rows = self._db.execute("SELECT title FROM published").fetchall()
+        return [title for (title,) in rows]
+
+    def load_published(self, limit: int = 500) -> list[str]:
+        """Return the most recently published titles, oldest first."""
+        rows = self._db.execute(
+            "SELECT title FROM published ORDER BY ts DESC LIMIT ?", (limit,)
+        ).fetchall()
+        return [title for (title,) in reversed(rows)]
+
+    def close(self) -> None:
+        self._db.close()